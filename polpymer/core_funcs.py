@@ -10,9 +10,19 @@ functions in core_funcs.py
 
 # Module imports
 from typing import Tuple
-from random import choice
 import numpy as np
-from copy import deepcopy
+
+try:
+    from numba import njit, prange, get_num_threads
+except ImportError:
+    # Numba is optional, without it the kernels run as plain Python
+    def njit(*args, **kwargs):
+        if len(args) == 1 and callable(args[0]):
+            return args[0]
+        return lambda func: func
+    prange = range
+    def get_num_threads():
+        return 1
 
 
 # Defining global variables
@@ -22,13 +32,199 @@ ANGLE_TO_ADD: list[Tuple[int,int]] = [
     (-1,0),
     (0,-1)
 ]
+ANGLE_DX: np.ndarray = np.asarray([1, 0, -1, 0], dtype=np.int32)
+ANGLE_DY: np.ndarray = np.asarray([0, 1, 0, -1], dtype=np.int32)
+# Offset that makes site coordinates positive before they are packed into a
+# single integer key, see Polymer._pack
+SITE_OFFSET: int = 1 << 30
+# Amount of set bits in each 4-bit mask of free growth directions
+MASK_BITS: np.ndarray = np.asarray([bin(mask).count('1') for mask in range(16)],
+    dtype=np.int64)
+# Direction belonging to the k'th set bit of each 4-bit mask of free growth
+# directions, -1 where the mask has less than k+1 set bits
+MASK_DIRECTIONS: np.ndarray = np.asarray(
+    [[j for j in range(4) if (mask >> j) & 1] + [-1]*(4 - bin(mask).count('1'))
+        for mask in range(16)], dtype=np.int64)
 
 
 # Top-level functions and classes
+
+@njit(cache=True)
+def _grow_saw(xs, ys, angles, start, length, grid, draws):
+    """ Grows a self avoiding walk in place from node start until the walk
+    contains length monomers or gets trapped.
+
+    The claimed sites are marked on an occupancy grid centred on the first
+    node, only the cells of the walk are cleared afterwards so the same grid
+    can be reused for the next walk.
+
+    Parameters
+    ----------
+    xs, ys : np.ndarray
+        integer arrays of at least length+1 entries with the first start+1
+        nodes filled in
+    angles : np.ndarray
+        integer array of at least length entries receiving the angle of each
+        new monomer
+    start : int
+        Index of the current chain end in xs and ys
+    length : int
+        Amount of monomers to grow the walk to
+    grid : np.ndarray
+        Cleared square uint8 grid of at least 2*length+1 cells per side
+    draws : np.ndarray
+        Uniform random numbers in [0, 1), one per growth step, used to pick
+        among the free directions
+
+    Returns
+    -------
+    tuple[int, np.ndarray]
+        Index of the final chain end and the amount of growth options at each
+        growth step, ending with a 0 if the walk got trapped
+    """
+    ox = xs[0] - grid.shape[0]//2
+    oy = ys[0] - grid.shape[1]//2
+    for i in range(start+1):
+        grid[xs[i]-ox, ys[i]-oy] = 1
+
+    m = np.zeros(length-start+1, dtype=np.int64)
+    end = start
+    n_m = 0
+    while end < length:
+        mask = 0
+        for j in range(4):
+            nx = xs[end] + ANGLE_DX[j]
+            ny = ys[end] + ANGLE_DY[j]
+            if grid[nx-ox, ny-oy] == 0:
+                mask |= 1 << j
+        amnt = MASK_BITS[mask]
+
+        m[n_m] = amnt
+        n_m += 1
+        if amnt == 0:
+            break
+
+        ang = MASK_DIRECTIONS[mask, int(draws[end-start]*amnt)]
+        angles[end] = ang
+        xs[end+1] = xs[end] + ANGLE_DX[ang]
+        ys[end+1] = ys[end] + ANGLE_DY[ang]
+        grid[xs[end+1]-ox, ys[end+1]-oy] = 1
+        end += 1
+
+    for i in range(end+1):
+        grid[xs[i]-ox, ys[i]-oy] = 0
+
+    return end, m[:n_m]
+
+
+@njit(parallel=True, cache=True)
+def _grow_many(N, length, ox, oy, grids, draws):
+    """ Grows N independent self avoiding walks from (ox, oy) in parallel,
+    the walks are divided over the occupancy grids which each serve one
+    thread.
+
+    Parameters
+    ----------
+    N : int
+        Amount of walks to grow
+    length : int
+        Amount of monomers to grow each walk to
+    ox, oy : int
+        Coordinates of the origin of every walk
+    grids : np.ndarray
+        Stack of cleared occupancy grids, see _grow_saw
+    draws : np.ndarray
+        Array of shape (N, length) with the uniform random numbers of each
+        walk, see _grow_saw
+
+    Returns
+    -------
+    tuple[np.ndarray, ...]
+        Nodes (xs, ys) and angles of each walk, the growth options at each
+        step of each walk, and per walk the index of the chain end and the
+        amount of growth options stored
+    """
+    xs = np.empty((N, length+1), dtype=np.int32)
+    ys = np.empty((N, length+1), dtype=np.int32)
+    angles = np.empty((N, length), dtype=np.int8)
+    m = np.zeros((N, length+1), dtype=np.int64)
+    ends = np.empty(N, dtype=np.int64)
+    n_m = np.empty(N, dtype=np.int64)
+
+    n_grids = grids.shape[0]
+    for k in prange(n_grids):
+        for i in range(k, N, n_grids):
+            xs[i, 0] = ox
+            ys[i, 0] = oy
+            end, m_i = _grow_saw(xs[i], ys[i], angles[i], 0, length, grids[k],
+                draws[i])
+            ends[i] = end
+            n_m[i] = len(m_i)
+            m[i, :len(m_i)] = m_i
+
+    return xs, ys, angles, m, ends, n_m
+
+
+def _extend_rows(a, rows, fill=0):
+    """ Returns a copy of array a extended to the given amount of rows along
+    its first axis, the added rows are set to fill
+    """
+    new = np.full((rows,) + a.shape[1:], fill, dtype=a.dtype)
+    new[:len(a)] = a
+    return new
+
+
+def _chain_observables(xs, ys, out=None):
+    """ Computes the end-to-end distances and radii of gyration of all
+    sub-chains starting at the first node, for one chain or a stack of chains
+    with the nodes along the last axis.
+
+    Parameters
+    ----------
+    xs, ys : np.ndarray
+        Coordinates of the L+1 nodes of each chain
+    out : tuple[np.ndarray, np.ndarray], optional
+        Float arrays of the shape of the results to write them into, by
+        default new arrays are allocated
+
+    Returns
+    -------
+    tuple[np.ndarray, np.ndarray]
+        Squared end-to-end distances between node 0 and node j+1, and radii of
+        gyration of nodes 0 to j, for j from 0 to L-1
+    """
+    x_ = np.asarray(xs, dtype=np.int64)
+    y_ = np.asarray(ys, dtype=np.int64)
+    L = x_.shape[-1] - 1
+
+    if out is None:
+        shape = x_.shape[:-1] + (L,)
+        out = (np.empty(shape), np.empty(shape))
+    end_to_end, gyration = out
+
+    dx = x_[...,1:] - x_[...,:1]
+    dy = y_[...,1:] - y_[...,:1]
+    np.add(dx*dx, dy*dy, out=end_to_end)
+
+    # Running sums and second moments of the first j+1 nodes give the
+    # radius of gyration of every sub-chain in a single pass. The sums stay
+    # integers, the centre of mass is only divided out at the end as
+    # (n*sum(r^2) - sum(r)^2)/n^2
+    n = np.arange(1, L+1)
+    sx = np.cumsum(x_[...,:L], axis=-1)
+    sy = np.cumsum(y_[...,:L], axis=-1)
+    sr2 = np.cumsum(x_[...,:L]**2 + y_[...,:L]**2, axis=-1)
+    np.divide(n*sr2 - sx*sx - sy*sy, n*n, out=gyration)
+
+    return end_to_end, gyration
+
+
 class Monomer:
     """ Single Monomere element part of longe Polymer chain.
     single monomer groups together starting and ending point.
     """
+    __slots__ = ('angle', 'location', 'end_location')
+
     def __init__(self, ang: int):
         """Initialises Monomer class, takes single argument ang(le).
 
@@ -66,12 +262,13 @@ class Monomer:
         if self.location is None:
             raise ValueError("Location of end not possible when location is None")
         else:
-            add = ANGLE_TO_ADD[self.angle]
-            start_loc = self.location
-            self.end_location = (start_loc[0]+add[0], start_loc[1]+add[1])
+            dx, dy = ANGLE_TO_ADD[self.angle]
+            x, y = self.location
+            self.end_location = (x+dx, y+dy)
 
 class Polymer:
-    """ Polymer object encapsulates dictionary of monomer objects
+    """ Polymer object stores the nodes and monomer angles of a polymer chain
+    in preallocated arrays, Monomer objects are only created on request
 
     Returns
     -------
@@ -95,23 +292,32 @@ class Polymer:
     chain_start: Tuple[int,int] = None
     chain_end: Tuple[int,int] = None
 
-    monomers: dict[int, Monomer] = {}
-    claimed_sites: list[Tuple[int,int]] = []
+    _xs: np.ndarray = None
+    _ys: np.ndarray = None
+    _angles: np.ndarray = None
+    _sites: set[int] = None
 
     nodes_locsx: np.ndarray = None
     nodes_locsy: np.ndarray = None
-    node_m_vals: list[int,...] = []
-    node_weights: list[int,...] = []
+    node_m_vals: np.ndarray = None
+    node_weights: np.ndarray = None
 
     end_to_end: np.ndarray = None
     gyration: np.ndarray = None
 
     pruned: bool = None
+    rng: np.random.Generator = None
+    # Rosenbluth weight of the chain as set by the last growth kernel, the
+    # product of its growth options. Chains without recorded growth options,
+    # such as free random walks, keep 1.0 and add_monomer leaves it unchanged
+    weight: float = 1.0
 
     def __init__(self,
         dims: Tuple[int, int],
         origin: Tuple[int,int],
-        init_with_monomer: bool=True):
+        init_with_monomer: bool=True,
+        max_len: int=512,
+        rng: np.random.Generator=None):
         """ Initialises the Polymer class with an initial Monomer
 
         Parameters
@@ -120,48 +326,159 @@ class Polymer:
             Amount of nodes in either x and y direction, unused for now
         origin : Tuple[int,int]
             Starting node of the first monomer
-        starting_monomer : Monomer
-            Monomer object that will start the chain
+        init_with_monomer : bool, optional
+            Whether the first monomer gets a random angle, by default True,
+            otherwise it points in the x direction
+        max_len : int, optional
+            Amount of monomers to allocate storage for, the storage grows when
+            the polymer exceeds it, by default 512
+        rng : np.random.Generator, optional
+            Source of all random numbers used to grow the polymer, by default
+            a new unseeded generator
         """
 
         self.dimensions = dims
         self.origin = origin
         self.chain_start = origin
+        self.rng = np.random.default_rng(rng)
 
         if init_with_monomer:
-            starting_monomer = Monomer(choice([0,1,2,3]))
+            ang = int(self.rng.integers(4))
         else:
-            starting_monomer = Monomer(0)
+            ang = 0
 
-        starting_monomer.location = origin
-        starting_monomer.calculate_end()
+        self._xs = np.empty(max_len+1, dtype=np.int32)
+        self._ys = np.empty(max_len+1, dtype=np.int32)
+        self._angles = np.empty(max_len, dtype=np.int8)
 
+        self._xs[0], self._ys[0] = origin
+        self._angles[0] = ang
+        self._xs[1] = self._xs[0] + ANGLE_DX[ang]
+        self._ys[1] = self._ys[0] + ANGLE_DY[ang]
 
-        self.chain_end = starting_monomer.end_location
-        self.monomers = {}
-        self.monomers['monomer_0'] = starting_monomer
+        self.chain_end = (int(self._xs[1]), int(self._ys[1]))
         self.chain_length = 1
 
-        self.claimed_sites = [origin, self.chain_end]
+        self._sites = {self._pack(*origin), self._pack(*self.chain_end)}
 
+        self.node_m_vals = []
+        self.node_weights = []
         self.pruned = False
 
     def __iter__(self) -> Monomer:
-        for i in range(len(self)):
-            string: str = 'monomer_{}'.format(str(i))
-            yield self.monomers[string]
+        # The nodes are converted to lists once rather than read one
+        # NumPy scalar at a time
+        L = self.chain_length
+        xs = self._xs[:L+1].tolist()
+        ys = self._ys[:L+1].tolist()
+        for i, ang in enumerate(self._angles[:L].tolist()):
+            monomer = Monomer(ang)
+            monomer.location = (xs[i], ys[i])
+            monomer.end_location = (xs[i+1], ys[i+1])
+            yield monomer
 
     def __str__(self):
         string: str = "Polymer chain consisting of {} monomers".format(self.chain_length)
         return string
 
     def __getitem__(self, item):
-        item_str: str = "monomer_{}".format(item+1)
-        return self.monomers[item_str]
+        if item < 0:
+            item += self.chain_length
+        if not 0 <= item < self.chain_length:
+            raise IndexError("Polymer index out of range")
+        return self._monomer(item)
 
     def __len__(self):
         return self.chain_length
 
+    @staticmethod
+    def _pack(x: int, y: int) -> int:
+        """ Packs the coordinates of a site into a single integer key, also
+        works elementwise on int64 arrays
+        """
+        return (x + SITE_OFFSET) | ((y + SITE_OFFSET) << 32)
+
+    @property
+    def claimed_sites(self) -> set[Tuple[int,int]]:
+        """ Sites occupied by the polymer as coordinate tuples
+        """
+        return {((key & 0xFFFFFFFF) - SITE_OFFSET, (key >> 32) - SITE_OFFSET)
+            for key in self._sites}
+
+    @claimed_sites.setter
+    def claimed_sites(self, sites: set[Tuple[int,int]]):
+        self._sites = {self._pack(x, y) for (x, y) in sites}
+
+    def node_arrays(self) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """ Views of the stored chain, without copying
+
+        Returns
+        -------
+        Tuple[np.ndarray, np.ndarray, np.ndarray]
+            x and y coordinates of the chain_length+1 nodes and the angles of
+            the chain_length monomers
+        """
+        L = self.chain_length
+        return self._xs[:L+1], self._ys[:L+1], self._angles[:L]
+
+    @classmethod
+    def _from_walk(cls, dims: Tuple[int,int], origin: Tuple[int,int],
+        xs: np.ndarray, ys: np.ndarray, angles: np.ndarray, end: int,
+        m: np.ndarray, rng: np.random.Generator):
+        """ Wraps node and angle arrays filled in by one of the growth kernels
+        in a polymer, the arrays are used as its storage without copying
+
+        Parameters
+        ----------
+        dims : Tuple[int, int]
+            Amount of nodes in either x and y direction, unused for now
+        origin : Tuple[int,int]
+            Starting node of the first monomer
+        xs, ys, angles : np.ndarray
+            Node and angle arrays of the walk
+        end : int
+            Index of the chain end
+        m : np.ndarray
+            Amount of growth options at each growth step
+        rng : np.random.Generator
+            Source of the random numbers for growing the polymer further
+
+        Returns
+        -------
+        Polymer
+            Polymer made up of the walk
+        """
+        polymer = cls.__new__(cls)
+        polymer.dimensions = dims
+        polymer.origin = origin
+        polymer.chain_start = origin
+        polymer.node_weights = []
+        polymer.pruned = False
+        polymer.rng = rng
+        polymer._xs = xs
+        polymer._ys = ys
+        polymer._angles = angles
+        polymer._set_walk(end, m)
+        return polymer
+
+    def _monomer(self, i: int) -> Monomer:
+        """ Builds the Monomer object of the i'th monomer in the chain
+        """
+        xs, ys = self._xs, self._ys
+        monomer = Monomer(self._angles.item(i))
+        monomer.location = (xs.item(i), ys.item(i))
+        monomer.end_location = (xs.item(i+1), ys.item(i+1))
+        return monomer
+
+    def _reserve(self, length: int):
+        """ Grows the node and angle storage such that it fits length monomers
+        """
+        if length > len(self._angles):
+            size = max(length, 2*len(self._angles))
+            self._xs = np.resize(self._xs, size+1)
+            self._ys = np.resize(self._ys, size+1)
+            self._angles = np.resize(self._angles, size)
+
     def add_monomer(self, ang: int, loc: str = 'end'):
         """ Adds a monomer to the polymer chain
 
@@ -179,6 +496,11 @@ class Polymer:
             If string loc not 'start' or 'end'
         Exception
             If addition of monomer would create a self-crossing.
+
+        Notes
+        -----
+        The monomer is not weighted, node_m_vals and weight are left as they
+        are
         """
         if loc == 'start':
             start_loc = self.chain_start
@@ -188,21 +510,32 @@ class Polymer:
             raise ValueError("string location either 'start' or 'end',\
                  default is 'end'")
 
-        proposed_monomer = Monomer(ang)
-        proposed_monomer.location = start_loc
-        proposed_monomer.calculate_end()
-
-        if not self.conflict(proposed_monomer):
-            self.chain_length += 1
-            self.monomers['monomer_'+str(self.chain_length-1)] = proposed_monomer
-            if start_loc == self.chain_start:
-                self.chain_start = proposed_monomer.end_location
-            elif start_loc == self.chain_end:
-                self.chain_end = proposed_monomer.end_location
-            self.claimed_sites.append(self.chain_end)
-        else:
+        # The proposed end is checked before anything is stored, attaching to
+        # the chain start or end is guaranteed by the choice of start_loc
+        add = ANGLE_TO_ADD[ang]
+        end = (start_loc[0]+add[0], start_loc[1]+add[1])
+        key = self._pack(*end)
+        if key in self._sites:
             raise Exception("Proposed monomer's end location already a node of polymer")
 
+        n = self.chain_length
+        self._reserve(n+1)
+        if loc == 'end':
+            self._angles[n] = ang
+            self._xs[n+1], self._ys[n+1] = end
+            self.chain_end = end
+        else:
+            # The chain is stored from start to end, so the new monomer
+            # is prepended pointing back towards the old start
+            self._angles[1:n+1] = self._angles[0:n]
+            self._xs[1:n+2] = self._xs[0:n+1]
+            self._ys[1:n+2] = self._ys[0:n+1]
+            self._angles[0] = (ang + 2) % 4
+            self._xs[0], self._ys[0] = end
+            self.chain_start = end
+        self.chain_length += 1
+        self._sites.add(key)
+
 
     def conflict(self, prop_monomer: Monomer) -> bool:
         """ Function returns True if the proposed monomer's addition to the chain would cause a conflict. conflict include: closing the loop, a self crossing, and not attaching to the start or end of the polymer chain
@@ -217,107 +550,125 @@ class Polymer:
         bool
             Result of whether addition of monomer would cause conflict
         """
+        x, y = prop_monomer.end_location
+        if self._pack(x, y) in self._sites:
+            return True
+        # Monomers are nearly always proposed at the chain end
         start = prop_monomer.location
-        end = prop_monomer.end_location
-        cross: bool = bool(end in self.claimed_sites)
-        attach_end: bool = not bool((start == self.chain_start) or (start == self.chain_end))
-        is_conflicting: bool = bool(cross or attach_end)
-        return is_conflicting
+        return start != self.chain_end and start != self.chain_start
+
+    def allowed_directions(self) -> int:
+        """ Probes the four neighbours of the chain end at once
 
-    def observables(self):
+        Returns
+        -------
+        int
+            4-bit mask where bit j is set if a monomer with angle j can be
+            added to the chain end without a conflict
+        """
+        x, y = self.chain_end
+        mask = 0
+        for j, (dx, dy) in enumerate(ANGLE_TO_ADD):
+            if self._pack(x+dx, y+dy) not in self._sites:
+                mask |= 1 << j
+        return mask
+
+    def observables(self, out=None):
         """ Function computes the observables of self
 
+        Parameters
+        ----------
+        out : tuple[np.ndarray, np.ndarray], optional
+            Float arrays of length chain_length to write the end-to-end
+            distances and radii of gyration into, by default new arrays are
+            allocated
+
         Returns
         -------
         tuple[np.ndarray, np.ndarray]
             numpy array-like objects of polymers end-to-end distances and radii
             of gyration
         """
-        if (self.nodes_locsx is None) or (self.nodes_locsy is None):
-            self.compute_node_weights()
-
         L = self.chain_length
-        x_ = self.nodes_locsx
-        y_ = self.nodes_locsy
-
-        end_to_end = np.array([])
-        gyration = np.array([])
-
-        for i in range(L):
-            end_to_end_i = (x_[0] - x_[i+1])**2 + (y_[0] - y_[i+1])**2
-            end_to_end = np.append(end_to_end, end_to_end_i)
-
-            cm_x = 1/(i+1) * np.sum(x_[0:i+1])
-            cm_y = 1/(i+1) * np.sum(y_[0:i+1])
-
-            gyration_x_i = 1/(i+1) * np.sum((x_[0:i+1] - cm_x)**2)
-            gyration_y_i = 1/(i+1) * np.sum((y_[0:i+1] - cm_y)**2)
-            gyration_i = gyration_x_i + gyration_y_i
-            gyration = np.append(gyration, gyration_i)
+        return _chain_observables(self._xs[:L+1], self._ys[:L+1], out)
 
 
-        return end_to_end, gyration
-
-
-    def grow_polymer(self, length):
+    def grow_polymer(self, length, grid: np.ndarray=None):
         """randomly grows a polymer up to a length of L or until it can't grow anymore and stores the number of growth option for each growth step to determine the weigth of the polymer
 
+        Parameters
+        ----------
+        length : int
+            Length to grow the polymer to
+        grid : np.ndarray, optional
+            Cleared occupancy grid of at least 2*length+1 cells per side to
+            reuse, by default a new grid is allocated
         """
 
-        m = np.asarray([4], dtype=np.float64)
-        grow_directions = [0,1,2,3]
-        for i in range(length-1):
-            grow_options = [0,1,2,3]
-            for j in grow_directions:
-                proposed_monomer = Monomer(j)
-                proposed_monomer.location = self.chain_end
-                proposed_monomer.calculate_end()
-                if self.conflict(proposed_monomer):
-                    grow_options.remove(j)
-            if len(grow_options) > 0:
-                    #m[i] = len(grow_options)
-                    m = np.append(m, len(grow_options))
-                    self.add_monomer(choice(grow_options))
-            else:
-                m = np.append(m,0)
-                break
-        #m = m[m!=0]
-        self.node_m_vals = m
+        start = self.chain_length
+        length = max(length, start)
+        self._reserve(length)
+
+        if grid is None:
+            grid = np.zeros((2*length+1, 2*length+1), dtype=np.uint8)
+
+        draws = self.rng.random(length-start)
+        try:
+            end, m_new = _grow_saw(self._xs, self._ys, self._angles, start,
+                length, grid, draws)
+        except BaseException:
+            # An interrupted walk leaves its sites marked, the grid has to be
+            # cleared before it can be reused
+            grid[...] = 0
+            raise
+        m = np.empty(len(m_new)+1)
+        m[0] = 4
+        m[1:] = m_new
+        self._set_walk(end, m)
+
+    def _set_walk(self, end: int, m: np.ndarray):
+        """ Updates the chain after its node and angle arrays were filled in
+        up to node end by one of the growth kernels
+
+        Parameters
+        ----------
+        end : int
+            Index of the chain end
+        m : np.ndarray
+            Amount of growth options at each growth step
+        """
+        self.chain_length = end
+        self.chain_end = (int(self._xs[end]), int(self._ys[end]))
+        keys = self._pack(self._xs[:end+1].astype(np.int64),
+            self._ys[:end+1].astype(np.int64))
+        self._sites = set(keys.tolist())
+
+        self.nodes_locsx = self._xs[:end+1].astype(np.float64)
+        self.nodes_locsy = self._ys[:end+1].astype(np.float64)
+        # Stored as floats, the products of the growth options overflow
+        # integers for long polymers
+        self.node_m_vals = np.asarray(m, dtype=np.float64)
+        if len(self.node_m_vals) >= end:
+            self.weight = float(np.prod(self.node_m_vals[:end]))
+        else:
+            self.weight = 1.0
 
     def compute_node_weights(self):
         """ Computes the weights of each node in self
         """
-        m = self.node_m_vals
+        m = np.asarray(self.node_m_vals, dtype=np.float64)
         length = self.chain_length
 
-        x_ = np.array([])
-        y_ = np.array([])
-        w_ = np.array([])
-
-        polymer = self
-
-        for monomer in polymer:
-            start = monomer.location
-
-            x_ = np.append(x_, start[0])
-            y_ = np.append(y_, start[1])
-
-        x_ = np.append(x_, polymer.chain_end[0])
-        y_ = np.append(y_, polymer.chain_end[1])
-
-        for i in range(length):
-            w_ = np.append(w_, np.prod(m[0:i+1]))
-
-        self.nodes_locsx = x_
-        self.nodes_locsy = y_
-        self.node_weights = w_
+        self.nodes_locsx = self._xs[:length+1].astype(np.float64)
+        self.nodes_locsy = self._ys[:length+1].astype(np.float64)
+        self.node_weights = np.cumprod(m[:length])
 
 
 class Dish: #As in a Petri-dish
     """ Petri-dish like object, allows for the collection of Polymer objects within a single class. Allows for easy creation of Polymer ensembles.
     """
 
-    polymers: list[object,...] = []
+    polymers: list[object,...] = None
     end_to_end: np.ndarray = None
     gyration: np.ndarray = None
     weights: np.ndarray = None
@@ -325,13 +676,54 @@ class Dish: #As in a Petri-dish
     bouqet: list[Polymer,...] = None
     correlation_matrix: np.ndarray = None
     corr_metric: float = None
+    _grids: np.ndarray = None
+    rng: np.random.Generator = None
 
-    def __init__(self, dims: Tuple[int,int], origin: Tuple[int,int]):
+    def __init__(self, dims: Tuple[int,int], origin: Tuple[int,int],
+        seed=None):
+        """ Initialises an empty Dish
+
+        Parameters
+        ----------
+        dims : Tuple[int, int]
+            Amount of nodes in either x and y direction, unused for now
+        origin : Tuple[int,int]
+            Starting node of every polymer
+        seed : int or np.random.Generator, optional
+            Seed of the generator that draws every random number of the
+            simulations in this Dish, by default it is seeded from the OS
+        """
         self.dimension = dims
         self.origin = origin
         self.polymers = []
+        self.rng = np.random.default_rng(seed)
 
+    def _occupancy_grids(self, length: int, amnt: int) -> np.ndarray:
+        """ Returns amnt cleared occupancy grids that fit polymers of the given
+        length, the grids are kept and reused by the following calls. Callers
+        clear or drop the grids when a walk on them does not finish
 
+        Parameters
+        ----------
+        length : int
+            Length of the polymers that are to be grown on the grids
+        amnt : int
+            Amount of grids needed
+
+        Returns
+        -------
+        np.ndarray
+            Array of shape (amnt, size, size) with size at least 2*length+1
+        """
+        size = 2*length + 1
+        grids = self._grids
+        if grids is None or grids.shape[0] < amnt or grids.shape[1] < size:
+            shape = (amnt, size, size)
+            if grids is not None:
+                shape = (max(amnt, grids.shape[0]), max(size, grids.shape[1]),
+                    max(size, grids.shape[1]))
+            self._grids = np.zeros(shape, dtype=np.uint8)
+        return self._grids[:amnt]
 
     def find_N_polymer(self, N: int, length: int):
         """find a polymer that has the desired lenght L
@@ -349,14 +741,27 @@ class Dish: #As in a Petri-dish
         dims = self.dimension
         origin = self.origin
 
+        grids = self._occupancy_grids(length, min(N, get_num_threads()))
+
         n = 0
         while n != N:
-            trial_polymer = Polymer(dims, origin)
-            trial_polymer.grow_polymer(length)
-            self.polymers.append(trial_polymer)
-            L = trial_polymer.chain_length
-            if L == length:
-                n += 1
+            # A batch of N-n walks can not overshoot N polymers of the
+            # desired length, the search ends with a batch that all succeed
+            batch = N - n
+            draws = self.rng.random((batch, length))
+            try:
+                xs, ys, angles, m, ends, n_m = _grow_many(batch, length,
+                    origin[0], origin[1], grids, draws)
+            except BaseException:
+                # An interrupted batch leaves sites marked on the grids, so
+                # they are thrown away instead of reused
+                self._grids = None
+                raise
+
+            self.polymers.extend(Polymer._from_walk(dims, origin, xs[i], ys[i],
+                angles[i], int(ends[i]), m[i, :n_m[i]], self.rng)
+                for i in range(batch))
+            n += int(np.count_nonzero(ends == length))
 
 
     def find_polymer(self, length: int):
@@ -377,10 +782,12 @@ class Dish: #As in a Petri-dish
         dims = self.dimension
         origin = self.origin
 
+        grid = self._occupancy_grids(length, 1)[0]
+
         n = 0
         while n != length:
-            trial_polymer = Polymer(dims, origin)
-            trial_polymer.grow_polymer(length)
+            trial_polymer = Polymer(dims, origin, rng=self.rng)
+            trial_polymer.grow_polymer(length, grid)
             n = trial_polymer.chain_length
 
         m = trial_polymer.node_m_vals
@@ -407,22 +814,38 @@ class Dish: #As in a Petri-dish
             N x L matrix where the (i,j) element represents the weight of polymer
         """
         N = len(self.polymers)
-        end_to_end = np.zeros((N,length))
-        gyration = np.zeros((N,length))
-        w = np.zeros((N,length))
-
-        for i in range(N):
-            polymer = self.polymers[i]
-
-            polymer.compute_node_weights()
-            x_i = polymer.nodes_locsx
-            y_i = polymer.nodes_locsy
-            w_i = polymer.node_weights
-            end_to_end_i, gyration_i = polymer.observables()
-
-            end_to_end[i,:] = np.append(end_to_end_i,np.zeros(length-polymer.chain_length))
-            gyration[i,:] = np.append(gyration_i,np.zeros(length-polymer.chain_length))
-            w[i,:] = np.append(w_i,np.zeros(length-polymer.chain_length))
+        xs = np.zeros((N,length+1), dtype=np.int32)
+        ys = np.zeros((N,length+1), dtype=np.int32)
+        m = np.zeros((N,length))
+        lengths = np.empty(N, dtype=np.int64)
+
+        # Gathering the ensemble into row-wise arrays such that the weights
+        # and observables of all polymers are computed at once
+        for i, polymer in enumerate(self.polymers):
+            L_i = polymer.chain_length
+            m_i = np.asarray(polymer.node_m_vals, dtype=np.float64)[:L_i]
+            xs[i,:L_i+1] = polymer._xs[:L_i+1]
+            ys[i,:L_i+1] = polymer._ys[:L_i+1]
+            m[i,:len(m_i)] = m_i
+            lengths[i] = L_i
+
+        # The rows are zero padded beyond the length of the polymer
+        padding = np.arange(length) >= lengths[:, np.newaxis]
+
+        w = np.cumprod(m, axis=1, out=m)
+        w[padding] = 0
+
+        end_to_end = np.empty((N,length))
+        gyration = np.empty((N,length))
+        _chain_observables(xs, ys, out=(end_to_end, gyration))
+        end_to_end[padding] = 0
+        gyration[padding] = 0
+
+        for i, polymer in enumerate(self.polymers):
+            L_i = lengths[i]
+            polymer.nodes_locsx = polymer._xs[:L_i+1].astype(np.float64)
+            polymer.nodes_locsy = polymer._ys[:L_i+1].astype(np.float64)
+            polymer.node_weights = w[i,:L_i]
 
         self.end_to_end = end_to_end
         self.gyration = gyration
@@ -454,76 +877,132 @@ class Dish: #As in a Petri-dish
         """
         cminus = cplus/10
 
-        for i in range(N):
-            m, polymer = self.find_polymer(1)
-            self.polymers.append(polymer)
-
-        grow_directions = [0,1,2,3]
+        dims = self.dimension
+        (ox, oy) = self.origin
+        rng = self.rng
+
+        # The ensemble is stored row-wise so every growth step and the pruning
+        # and enrichment decisions act on all polymers at once
+        first = rng.integers(0, 4, size=N)
+        xs = np.zeros((N, L+1), dtype=np.int32)
+        ys = np.zeros((N, L+1), dtype=np.int32)
+        angles = np.zeros((N, L), dtype=np.int8)
+        m = np.zeros((N, L))
+
+        xs[:,0], ys[:,0] = ox, oy
+        xs[:,1] = ox + ANGLE_DX[first]
+        ys[:,1] = oy + ANGLE_DY[first]
+        angles[:,0] = first
+        m[:,0] = 4
+
+        lengths = np.ones(N, dtype=np.int64)
+        weight = np.full(N, 4.)
+        pruned = np.zeros(N, dtype=bool)
+        filled = N
+
+        # Polymers that are still growing all have their chain end at the
+        # same node, so only their rows are visited in each step
+        active = np.arange(N)
+        trapped_weight = 0.
 
         for i in range(L-1):
 
-            w = []
-            N_polymers = 0
-            for polymer in self.polymers:
-                m = np.asarray(polymer.node_m_vals, dtype=np.float64)
-                grow_options = [0,1,2,3]
-                if not polymer.pruned:
-                    for j in grow_directions:
-                        proposed_monomer = Monomer(j)
-                        proposed_monomer.location = polymer.chain_end
-                        proposed_monomer.calculate_end()
-                        if polymer.conflict(proposed_monomer):
-                            grow_options.remove(j)
-                    if len(grow_options) > 0:
-                        m = np.append(m,len(grow_options))
-                        polymer.add_monomer(choice(grow_options))
-                        N_polymers += 1
-                    else:
-                        polymer.pruned = True
-                        m = np.append(m,0)
-
-                else:
-                    m = np.append(m,0)
-                polymer.node_m_vals = m
-                polymer.compute_node_weights()
-                w.append(polymer.node_weights[-1])
-
-
-            W_tilde = sum(w)/N_polymers
+            # Probing the four neighbours of the chain end of every growing
+            # polymer against its walk, the chain end of a growing polymer is
+            # node i+1. On the square lattice a neighbour of node i+1 can only
+            # be one of the nodes i, i-2, ..., so only those are compared
+            grow = active
+            ex = xs[grow, i+1, np.newaxis] + ANGLE_DX
+            ey = ys[grow, i+1, np.newaxis] + ANGLE_DY
+            wx = xs[grow, i::-2]
+            wy = ys[grow, i::-2]
+            free = ~np.any((ex[:,:,np.newaxis] == wx[:,np.newaxis,:])
+                & (ey[:,:,np.newaxis] == wy[:,np.newaxis,:]), axis=2)
+            mask = free @ (1 << np.arange(4))
+            amnt = MASK_BITS[mask]
+
+            trapped = grow[amnt == 0]
+            pruned[trapped] = True
+            trapped_weight += np.sum(weight[trapped])
+            has_options = amnt > 0
+            grow = grow[has_options]
+            mask = mask[has_options]
+            amnt = amnt[has_options]
+            if len(grow) == 0:
+                break
+
+            # Picking a uniformly random free direction for each polymer
+            k = (rng.random(len(grow))*amnt).astype(np.int64)
+            ang = MASK_DIRECTIONS[mask, k]
+
+            angles[grow, i+1] = ang
+            xs[grow, i+2] = xs[grow, i+1] + ANGLE_DX[ang]
+            ys[grow, i+2] = ys[grow, i+1] + ANGLE_DY[ang]
+            lengths[grow] += 1
+            m[grow, i+1] = amnt
+            weight[grow] *= amnt
+
+            # Trapped polymers keep their weight in the average
+            N_polymers = len(grow)
+            W_tilde = (trapped_weight + np.sum(weight[grow]))/N_polymers
             W_plus = cplus*W_tilde
             W_minus = cminus*W_tilde
 
-            copied_polymers = []
-
-            for polymer in self.polymers:
-                if not polymer.pruned:
-                    if polymer.node_weights[-1] < W_minus:
-                        if choice([0,1]) == 0:
-                            polymer.node_m_vals[-1] = 0
-                            polymer.pruned = True
-                        else:
-                            polymer.node_m_vals[-1] = 2*polymer.node_m_vals[-1]
-                        polymer.compute_node_weights()
-                    elif polymer.node_weights[-1] > W_plus:
-                        polymer.node_m_vals[-1] = 0.5*polymer.node_m_vals[-1]
-                        polymer.compute_node_weights()
-                        copied_polymers.append(deepcopy(polymer))
-
-            for polymer in copied_polymers:
-                self.polymers.append(polymer)
-
-        amnt = len(self.polymers)
-
-        end_to_end = np.zeros((amnt,L))
-        gyration = np.zeros((amnt,L))
-        w = np.zeros((amnt,L))
-
-        for i in range(amnt):
-            polymer = self.polymers[i]
-            w_i = polymer.node_weights
-            end = len(w_i)
-            w[i,0:end] = w_i
-            end_to_end[i,0:end], gyration[i,0:end] = polymer.observables()
+            low = grow[weight[grow] < W_minus]
+            high = grow[weight[grow] > W_plus]
+
+            # Half of the low weight polymers are pruned, the other half
+            # doubles its weight
+            coin = rng.integers(0, 2, size=len(low)) == 0
+            prune = low[coin]
+            keep = low[~coin]
+            m[prune, i+1] = 0
+            weight[prune] = 0
+            pruned[prune] = True
+            m[keep, i+1] *= 2
+            weight[keep] *= 2
+
+            # High weight polymers halve their weight and get enriched
+            m[high, i+1] *= 0.5
+            weight[high] *= 0.5
+            # The copies go into spare rows, the storage doubles when it
+            # runs out such that the ensemble is not copied every step
+            if filled + len(high) > len(lengths):
+                rows = max(filled + len(high), 2*len(lengths))
+                xs, ys, angles, m, lengths, weight, pruned = (
+                    _extend_rows(a, rows) for a in
+                    (xs, ys, angles, m, lengths, weight, pruned))
+
+            new = np.arange(filled, filled + len(high))
+            xs[new] = xs[high]
+            ys[new] = ys[high]
+            angles[new] = angles[high]
+            m[new] = m[high]
+            lengths[new] = lengths[high]
+            weight[new] = weight[high]
+            filled += len(high)
+
+            active = np.concatenate((grow[~pruned[grow]], new))
+
+        xs, ys, angles = xs[:filled], ys[:filled], angles[:filled]
+        m, lengths, pruned = m[:filled], lengths[:filled], pruned[:filled]
+
+        # Zero padding the results beyond the length of each polymer
+        padding = np.arange(L) >= lengths[:, np.newaxis]
+
+        w = np.cumprod(m, axis=1)
+        w[padding] = 0
+
+        end_to_end, gyration = _chain_observables(xs, ys)
+        end_to_end[padding] = 0
+        gyration[padding] = 0
+
+        for i in range(filled):
+            polymer = Polymer._from_walk(dims, self.origin, xs[i], ys[i],
+                angles[i], int(lengths[i]), m[i], self.rng)
+            polymer.node_weights = w[i,:lengths[i]]
+            polymer.pruned = bool(pruned[i])
+            self.polymers.append(polymer)
 
         self.weights = w
         self.end_to_end = end_to_end
@@ -535,44 +1014,25 @@ class Dish: #As in a Petri-dish
 
 
         """
-        for i in range(N):
-            m, polymer = self.find_polymer(1)
-            self.polymers.append(polymer)
-
-        grow_directions = [0,1,2,3]
-
-        end_to_end = np.zeros((N,length))
-        gyration = np.zeros((N,length))
-
-        j = 0
-
-        for polymer in self.polymers:
-            for i in range(length-1):
-                polymer.claimed_sites = []
-                polymer.add_monomer(choice(grow_directions))
-
-
-            x_ = np.array([])
-            y_ = np.array([])
-
-
-            for monomer in polymer:
-                start = monomer.location
-
-                x_ = np.append(x_, start[0])
-                y_ = np.append(y_, start[1])
-
-            x_ = np.append(x_, polymer.chain_end[0])
-            y_ = np.append(y_, polymer.chain_end[1])
-
-            polymer.nodes_locsx = x_
-            polymer.nodes_locsy = y_
-
-            end_to_end_i, gyration_i = polymer.observables()
-            end_to_end[j,:] = end_to_end_i
-            gyration[j,:] = gyration_i
-
-            j += 1
+        (ox, oy) = self.origin
+
+        # Free walks need no conflict checks, so every direction is drawn up
+        # front and the nodes follow from the running sum of the steps
+        angles = self.rng.integers(0, 4, size=(N, length), dtype=np.int8)
+        xs = np.empty((N, length+1), dtype=np.int32)
+        ys = np.empty((N, length+1), dtype=np.int32)
+        xs[:,0], ys[:,0] = ox, oy
+        np.cumsum(ANGLE_DX[angles], axis=1, out=xs[:,1:])
+        np.cumsum(ANGLE_DY[angles], axis=1, out=ys[:,1:])
+        xs[:,1:] += ox
+        ys[:,1:] += oy
+
+        self.polymers.extend(Polymer._from_walk(self.dimension, self.origin,
+            xs[i], ys[i], angles[i], length, [4], self.rng) for i in range(N))
+
+        end_to_end = np.empty((N,length))
+        gyration = np.empty((N,length))
+        _chain_observables(xs, ys, out=(end_to_end, gyration))
 
         self.end_to_end = end_to_end
         self.gyration = gyration
@@ -593,22 +1053,16 @@ class Dish: #As in a Petri-dish
         max_chain_length: int = max(polymer_lengths)
 
         # We create an array that characterises all polymers by their angles
-        angles: np.ndarray[int] = np.zeros((polymer_amnt, max_chain_length)) + 8
+        angles: np.ndarray[int] = np.full((polymer_amnt, max_chain_length), 8,
+            dtype=np.int8)
 
-        i = 0
-        for polymer in self.polymers:
-            monomer_angles: list[int,...] = []
-            for monomer in polymer:
-                ang: int = monomer.angle
-                monomer_angles.append(ang)
-
-            length: int = len(monomer_angles)
-            angles[i,0:length] = monomer_angles
-            i += 1
+        for i, polymer in enumerate(self.polymers):
+            length: int = polymer.chain_length
+            angles[i,0:length] = polymer._angles[:length]
 
         # Rotating polymers such that their first monomers overlap angle 0
         first_angle: np.ndarray = angles[:,0]
-        mask = np.where(angles==8, True, False)
+        mask = angles == 8
         angles: np.ndarray = angles - first_angle[:, np.newaxis]
 
         # Removing negative angles
@@ -621,17 +1075,17 @@ class Dish: #As in a Petri-dish
             bouqet: list[Polymer,...] = []
 
             for i in range(polymer_amnt):
-                new_polymer = Polymer(
-                    self.dimension,
-                    (0,0),
-                    init_with_monomer=False
-                )
-
-                for angle in angles[i,1:]:
-                    if angle != 100:
-                        new_polymer.add_monomer(angle)
-                    else:
-                        pass
+                length: int = polymer_lengths[i]
+
+                # Rotation keeps the walk self avoiding, so the nodes follow
+                # directly from the rotated angles
+                steps: np.ndarray = angles[i,0:length].copy()
+                xs = np.zeros(length+1, dtype=np.int32)
+                ys = np.zeros(length+1, dtype=np.int32)
+                xs[1:] = np.cumsum(ANGLE_DX[steps])
+                ys[1:] = np.cumsum(ANGLE_DY[steps])
+                new_polymer = Polymer._from_walk(self.dimension, (0,0), xs, ys,
+                    steps, length, [], self.rng)
                 bouqet.append(new_polymer)
             self.bouqet = bouqet
 
@@ -678,51 +1132,21 @@ def correlation_angles(angles):
         ndarray of the correlation between polymer i and j.
     """
 
-    (amnt, trash) = angles.shape
-
-    correlation_matrix = np.zeros((amnt,amnt))
-
-    for i in range(amnt):
-
-        # Decoding the angles array for the ith polymer's angles
-        trace_i = angles[i]
-        x_i = np.where((trace_i == 0) | (trace_i == 2) | (trace_i == 100),
-            trace_i, 100)
-        y_i = np.where((trace_i == 1) | (trace_i == 3) | (trace_i == 100),
-            trace_i, 100)
-
-        x_i_ = np.where(x_i == 0, 1, 0)
-        x_i = np.where(x_i == 2, -1, 0) + x_i_
-
-        y_i_ = np.where(y_i == 1, 1, 0)
-        y_i = np.where(y_i == 3, -1, 0) + y_i_
-
-        xi_mean = np.average(x_i)
-        yi_mean = np.average(y_i)
-
-        for j in range(amnt):
-            trace_j = angles[j]
-            x_j = np.where((trace_j == 0) | (trace_j == 2) | (trace_j == 100),
-                trace_i, 100)
-            y_j = np.where((trace_j == 1) | (trace_j == 3) | (trace_j == 100),
-                trace_j, 100)
-
-            x_j_ = np.where(x_j == 0, 1, 0)
-            x_j = np.where(x_j == 2, -1, 0) + x_j_
-
-            y_j_ = np.where(y_j == 1, 1, 0)
-            y_j = np.where(y_j == 3, -1, 0) + y_j_
+    # Decoding the angles array into x and y signals for all polymers at once,
+    # padding (100) decodes to 0 in both signals
+    x = np.where(angles == 0, 1, np.where(angles == 2, -1, 0)).astype(np.float64)
+    y = np.where(angles == 1, 1, np.where(angles == 3, -1, 0)).astype(np.float64)
 
-            xj_mean = np.average(x_j)
-            yj_mean = np.average(y_j)
+    x_c = x - x.mean(axis=1, keepdims=True)
+    y_c = y - y.mean(axis=1, keepdims=True)
 
-            rx_ij = np.sum((x_i - xi_mean)*(x_j - xj_mean))/ \
-                np.sqrt(np.sum((x_i - xi_mean)**2)*np.sum((x_j-xj_mean)**2))
+    x_ss = np.sum(x_c**2, axis=1)
+    y_ss = np.sum(y_c**2, axis=1)
 
-            ry_ij = np.sum((y_i - yi_mean)*(y_j - yj_mean))/ \
-                np.sqrt(np.sum((y_i - yi_mean)**2)*np.sum((y_j-yj_mean)**2))
+    rx = (x_c @ x_c.T) / np.sqrt(np.outer(x_ss, x_ss))
+    ry = (y_c @ y_c.T) / np.sqrt(np.outer(y_ss, y_ss))
 
-            correlation_matrix[i,j] = np.sqrt(rx_ij**2 + ry_ij**2)
+    correlation_matrix = np.sqrt(rx**2 + ry**2)
 
     return correlation_matrix
 
@@ -745,10 +1169,10 @@ def correlation_metric(
         A single floating point value resembling the correlation of the polymer ensemble.
     """
 
-    shape = correlation_matrix.shape
+    n = correlation_matrix.shape[0]
 
-    ones = np.ones(shape)
-    metric = np.sum(np.tril(correlation_matrix))/np.sum(np.tril(ones))
+    lower = np.tri(n, dtype=bool)
+    metric = np.sum(correlation_matrix, where=lower)/(n*(n+1)/2)
 
     return metric
 
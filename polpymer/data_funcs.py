@@ -8,10 +8,9 @@ Results of the simulation can be analysed using the functions in data_funcs.py
 
 
 # Module imports
-from inspect import trace
 import matplotlib.pyplot as plt
-from polpymer.core_funcs import Polymer, Monomer, Dish
-from random import choice
+from polpymer.core_funcs import Dish
+from typing import Tuple
 import numpy as np
 
 
@@ -26,6 +25,42 @@ if __name__ == "__main__":
 
 
 # Functions
+def _stem_segments(polymers: list) -> Tuple[np.ndarray, ...]:
+    """ Collects the starting nodes and the stems of a list of polymers from
+    their node and angle arrays
+
+    Parameters
+    ----------
+    polymers : list
+        Polymer objects of any length
+
+    Returns
+    -------
+    Tuple[np.ndarray, ...]
+        x and y coordinates of the starting node of every monomer, the x and y
+        coordinates of the left end of every horizontal stem and the x and y
+        coordinates of the lower end of every vertical stem
+    """
+    if len(polymers) == 0:
+        empty = np.zeros(0, dtype=np.int32)
+        return (empty,)*6
+
+    chains = [polymer.node_arrays() for polymer in polymers]
+    x_ = np.concatenate([xs[:-1] for (xs, ys, angles) in chains])
+    y_ = np.concatenate([ys[:-1] for (xs, ys, angles) in chains])
+    x_end = np.concatenate([xs[1:] for (xs, ys, angles) in chains])
+    y_end = np.concatenate([ys[1:] for (xs, ys, angles) in chains])
+    angles = np.concatenate([angles for (xs, ys, angles) in chains])
+
+    horizontal = (angles == 0) | (angles == 2)
+    xlines_posx = np.minimum(x_, x_end)[horizontal]
+    xlines_posy = y_[horizontal]
+    ylines_posx = x_[~horizontal]
+    ylines_posy = np.minimum(y_, y_end)[~horizontal]
+
+    return x_, y_, xlines_posx, xlines_posy, ylines_posx, ylines_posy
+
+
 def plot_polymer(polymer: object) -> None:
     """ Function automates the plotting of a single polymer
 
@@ -35,43 +70,13 @@ def plot_polymer(polymer: object) -> None:
         intialised polymer object of any length
     """
 
-    x_ = np.asarray([])
-    y_ = np.asarray([])
-
-    xlines = np.asarray([])
-    xlines_posx = np.asarray([])
-    xlines_posy = np.asarray([])
-    ylines = np.asarray([])
-    ylines_posy = np.asarray([])
-    ylines_posx = np.asarray([])
+    (x_, y_, xlines_posx, xlines_posy, ylines_posx, ylines_posy) = \
+        _stem_segments([polymer])
 
     (xmax, ymax) = polymer.dimensions
-    cnt = 0
-
-    for monomer in polymer:
-        start = monomer.location
-        end = monomer.end_location
-
-        x_ = np.append(x_, start[0])
-        y_ = np.append(y_, start[1])
-
-        plt.text(x_[-1]+0.2, y_[-1]+0.2, str(cnt) )
-        cnt += 1
-        ang = monomer.angle
-        if ang == 0 or ang == 2:
-            if ang == 0:
-                xlines_posx = np.append(xlines_posx, start[0])
-            else:
-                xlines_posx = np.append(xlines_posx, end[0])
-            xlines = np.append(xlines, 1)
-            xlines_posy = np.append(xlines_posy, start[1])
-        if ang == 1 or ang == 3:
-            if ang == 1:
-                ylines_posy = np.append(ylines_posy, start[1])
-            else:
-                ylines_posy = np.append(ylines_posy, end[1])
-            ylines = np.append(ylines, 1)
-            ylines_posx = np.append(ylines_posx, start[0])
+
+    for cnt in range(len(x_)):
+        plt.text(x_[cnt]+0.2, y_[cnt]+0.2, str(cnt) )
 
     plt.xlim([0,xmax])
     plt.ylim([0,ymax])
@@ -103,39 +108,8 @@ def plot_dish(dish: object, bouqet: bool=False, stems: bool=False) -> None:
         polymers = dish.polymers
 
     if stems:
-        x_ = np.asarray([])
-        y_ = np.asarray([])
-
-        xlines = np.asarray([])
-        xlines_posx = np.asarray([])
-        xlines_posy = np.asarray([])
-        ylines = np.asarray([])
-        ylines_posy = np.asarray([])
-        ylines_posx = np.asarray([])
-
-        for polymer in polymers:
-            for monomer in polymer:
-                start = monomer.location
-                end = monomer.end_location
-
-                x_ = np.append(x_, start[0])
-                y_ = np.append(y_, start[1])
-
-                ang = monomer.angle
-                if ang == 0 or ang == 2:
-                    if ang == 0:
-                        xlines_posx = np.append(xlines_posx, start[0])
-                    else:
-                        xlines_posx = np.append(xlines_posx, end[0])
-                    xlines = np.append(xlines, 1)
-                    xlines_posy = np.append(xlines_posy, start[1])
-                if ang == 1 or ang == 3:
-                    if ang == 1:
-                        ylines_posy = np.append(ylines_posy, start[1])
-                    else:
-                        ylines_posy = np.append(ylines_posy, end[1])
-                    ylines = np.append(ylines, 1)
-                    ylines_posx = np.append(ylines_posx, start[0])
+        (x_, y_, xlines_posx, xlines_posy, ylines_posx, ylines_posy) = \
+            _stem_segments(polymers)
 
         plt.vlines(ylines_posx, ylines_posy, ylines_posy+1, color='black')
         plt.hlines(xlines_posy, xlines_posx, xlines_posx+1, color='black')
@@ -157,13 +131,9 @@ def plot_dish(dish: object, bouqet: bool=False, stems: bool=False) -> None:
             occur[coords] += 1
 
     # Process data in plottable sets
-    xs = np.asarray([])
-    ys = np.asarray([])
-    ss = np.asarray([])
-    for key in occur:
-        xs = np.append(xs, key[0])
-        ys = np.append(ys, key[1])
-        ss = np.append(ss, occur[key])
+    xs = np.asarray([key[0] for key in occur], dtype=np.float64)
+    ys = np.asarray([key[1] for key in occur], dtype=np.float64)
+    ss = np.asarray(list(occur.values()), dtype=np.float64)
 
     plt.scatter(xs, ys, ss)
     plt.show()